@@ -47,14 +47,14 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "black>=22.0.0",
             "flake8>=4.0.0",
             "mypy>=0.950",
         ],
         "test": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=3.0.0",
         ],
     },
@@ -5,6 +5,7 @@ This module provides configuration management for the Windows ChatGPT MCP server
 including ChatGPT window detection parameters and user preferences.
 """
 
+import copy
 import json
 import os
 import logging
@@ -120,6 +121,26 @@ class ConfigManager:
         self.server: Optional[ServerConfig] = None
         self.chatgpt: Optional[ChatGPTConfig] = None
     
+    @classmethod
+    def from_data(cls, config_path: Optional[str], data: Dict[str, Any]) -> "ConfigManager":
+        """
+        Create a configuration manager from already-loaded configuration data.
+        
+        Skips file I/O and validation, so ``data`` must be a complete, valid
+        configuration such as the ``config_data`` of a loaded manager.
+        
+        Args:
+            config_path: Path used by subsequent save operations
+            data: Configuration data to copy into the new manager
+            
+        Returns:
+            ConfigManager with configuration objects created from ``data``
+        """
+        manager = cls(config_path)
+        manager.config_data = copy.deepcopy(data)
+        manager._create_config_objects()
+        return manager
+    
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
         # Try multiple locations in order of preference
@@ -151,7 +172,7 @@ class ConfigManager:
                 self._validate_config()
             else:
                 self.logger.info(f"Configuration file not found at {self.config_path}, using defaults")
-                self.config_data = self.DEFAULT_CONFIG.copy()
+                self.config_data = copy.deepcopy(self.DEFAULT_CONFIG)
                 await self.save_config()
             
             # Create configuration objects
@@ -190,7 +211,7 @@ class ConfigManager:
                     result[key] = value
             return result
         
-        self.config_data = merge_dicts(self.DEFAULT_CONFIG, self.config_data)
+        self.config_data = merge_dicts(copy.deepcopy(self.DEFAULT_CONFIG), self.config_data)
     
     def _validate_window_detection_config(self) -> None:
         """Validate window detection configuration."""
@@ -5,23 +5,35 @@ This module provides comprehensive logging configuration with structured logging
 performance monitoring, metrics collection, and log rotation management.
 """
 
+import asyncio
+import bisect
+import copy
+import itertools
 import logging
 import logging.handlers
 import json
+import math
 import time
 import os
+import queue
 import sys
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Deque, Dict, Optional, Union, List
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from functools import wraps
+from functools import lru_cache, wraps
 from contextlib import contextmanager
 import threading
-from enum import Enum
+from collections import defaultdict, deque
+from enum import IntEnum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
-class LogLevel(Enum):
+
+class LogLevel(IntEnum):
     """Log levels for the application."""
     DEBUG = logging.DEBUG
     INFO = logging.INFO
@@ -30,18 +42,29 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
-@dataclass
+_NAME_TO_LEVEL = {level.name: level for level in LogLevel}
+
+
+@dataclass(init=False)
 class PerformanceMetric:
     """Performance metric data structure."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10); the optional
+    # metadata default lives in __init__ since slots cannot carry class defaults
+    __slots__ = ("operation", "duration", "timestamp", "success", "metadata")
+    
     operation: str
     duration: float
     timestamp: datetime
     success: bool
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any]
     
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    def __init__(self, operation: str, duration: float, timestamp: datetime,
+                 success: bool, metadata: Optional[Dict[str, Any]] = None):
+        self.operation = operation
+        self.duration = duration
+        self.timestamp = timestamp
+        self.success = success
+        self.metadata = {} if metadata is None else metadata
 
 
 @dataclass
@@ -59,51 +82,202 @@ class LoggingConfig:
     date_format: str = "%Y-%m-%d %H:%M:%S"
 
 
+# Attributes every LogRecord carries; anything else on a record came from `extra`
+_STD_LOGRECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None))
+) | {"message", "asctime"}
+
+
+# Route datetimes and dataclasses through default=str, as the stdlib fallback does
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+
+def _dumps_json(data: Dict[str, Any]) -> str:
+    """Serialize a log entry to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles these
+            pass
+    return json.dumps(data, default=str, ensure_ascii=False)
+
+
+_timestamp_cache = threading.local()
+
+
+def _format_timestamp(created: float) -> str:
+    """Render ``datetime.fromtimestamp(created).isoformat()``, reusing the
+    date/time prefix for records created within the same second."""
+    seconds = int(created)
+    micros = round((created - seconds) * 1e6)
+    if micros == 1000000:
+        # Rounds up into the next second; let datetime carry it
+        return datetime.fromtimestamp(created).isoformat()
+    
+    cached = getattr(_timestamp_cache, "value", None)
+    if cached is None or cached[0] != seconds:
+        cached = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds)))
+        _timestamp_cache.value = cached
+    
+    return f"{cached[1]}.{micros:06d}" if micros else cached[1]
+
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            # Queued records arrive with args already merged into msg
+            "message": record.getMessage() if record.args else str(record.msg),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
         
         # Add extra fields if present
-        if hasattr(record, '__dict__'):
-            for key, value in record.__dict__.items():
-                if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                              'filename', 'module', 'lineno', 'funcName', 'created',
-                              'msecs', 'relativeCreated', 'thread', 'threadName',
-                              'processName', 'process', 'getMessage', 'exc_info',
-                              'exc_text', 'stack_info']:
-                    log_data[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _STD_LOGRECORD_ATTRS:
+                log_data[key] = value
         
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data, default=str, ensure_ascii=False)
+        return _dumps_json(log_data)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler feeding a QueueListener that runs in this process."""
+    
+    def __init__(self, log_queue: queue.SimpleQueue, *handlers: logging.Handler):
+        super().__init__(log_queue)
+        self.listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+        self._listening = True
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records never leave the process, so only the message is frozen here;
+        # exc_info is kept for StructuredFormatter to render on the listener side
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def close(self) -> None:
+        # Also reached from logging.shutdown(), so queued records are written
+        # before the listener's handlers are closed
+        if self._listening:
+            self._listening = False
+            self.listener.stop()
+        super().close()
+
+
+class _TimestampView:
+    """Read-only view of metric timestamps, so bisect can search a deque of metrics."""
+    
+    __slots__ = ("metrics",)
+    
+    def __init__(self, metrics: Deque[PerformanceMetric]):
+        self.metrics = metrics
+    
+    def __len__(self) -> int:
+        return len(self.metrics)
+    
+    def __getitem__(self, index: int) -> datetime:
+        return self.metrics[index].timestamp
 
 
 class PerformanceMonitor:
     """Performance monitoring and metrics collection."""
     
-    def __init__(self):
+    # Upper bound on retained metrics; the oldest are dropped first
+    MAX_METRICS = 10000
+    
+    def __init__(self, max_metrics: int = MAX_METRICS):
         """Initialize performance monitor."""
-        self.metrics: List[PerformanceMetric] = []
+        self.max_metrics = max_metrics
+        self.metrics: Deque[PerformanceMetric] = deque(maxlen=max_metrics)
+        self._metrics_by_operation: Dict[str, Deque[PerformanceMetric]] = defaultdict(deque)
+        # Running aggregates per operation; the None key covers all operations
+        self._stats: Dict[Optional[str], Dict[str, Any]] = defaultdict(self._empty_stats)
+        # True while metrics were recorded in timestamp order, which lets time
+        # queries bisect instead of scanning
+        self._chronological = True
         self.lock = threading.Lock()
         self.logger = logging.getLogger(f"{__name__}.performance")
     
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {"count": 0, "sum": 0.0, "min": math.inf, "max": -math.inf,
+                "success": 0, "stale": False}
+    
+    def _add_to_stats(self, metric: PerformanceMetric) -> None:
+        """Fold a metric into the running aggregates."""
+        for key in (None, metric.operation):
+            stats = self._stats[key]
+            stats["count"] += 1
+            stats["sum"] += metric.duration
+            stats["min"] = min(stats["min"], metric.duration)
+            stats["max"] = max(stats["max"], metric.duration)
+            stats["success"] += int(metric.success)
+    
+    def _remove_from_stats(self, metric: PerformanceMetric) -> None:
+        """Take an evicted metric back out of the running aggregates."""
+        for key in (None, metric.operation):
+            stats = self._stats[key]
+            stats["count"] -= 1
+            if not stats["count"]:
+                del self._stats[key]
+                continue
+            stats["sum"] -= metric.duration
+            stats["success"] -= int(metric.success)
+            # min/max cannot be rolled back; recompute them on the next query
+            if metric.duration in (stats["min"], stats["max"]):
+                stats["stale"] = True
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the per-operation index and aggregates from the retained metrics."""
+        self._metrics_by_operation = defaultdict(deque)
+        self._stats = defaultdict(self._empty_stats)
+        self._chronological = True
+        previous = None
+        for metric in self.metrics:
+            self._metrics_by_operation[metric.operation].append(metric)
+            self._add_to_stats(metric)
+            if previous is not None and metric.timestamp < previous.timestamp:
+                self._chronological = False
+            previous = metric
+    
+    def _drop_oldest(self) -> None:
+        """Remove the oldest retained metric from the deque, index and aggregates."""
+        # The oldest metric overall is also the oldest for its operation
+        evicted = self.metrics.popleft()
+        operation_metrics = self._metrics_by_operation[evicted.operation]
+        operation_metrics.popleft()
+        if not operation_metrics:
+            del self._metrics_by_operation[evicted.operation]
+        self._remove_from_stats(evicted)
+    
     def record_metric(self, metric: PerformanceMetric) -> None:
         """Record a performance metric."""
         with self.lock:
+            if len(self.metrics) == self.max_metrics:
+                self._drop_oldest()
+            if self.metrics and metric.timestamp < self.metrics[-1].timestamp:
+                self._chronological = False
             self.metrics.append(metric)
+            self._metrics_by_operation[metric.operation].append(metric)
+            self._add_to_stats(metric)
             
             # Log the metric
             self.logger.info(
@@ -121,46 +295,70 @@ class PerformanceMonitor:
                    since: Optional[datetime] = None) -> List[PerformanceMetric]:
         """Get performance metrics with optional filtering."""
         with self.lock:
-            filtered_metrics = self.metrics.copy()
-            
             if operation:
-                filtered_metrics = [m for m in filtered_metrics if m.operation == operation]
+                metrics = self._metrics_by_operation.get(operation, deque())
+            else:
+                metrics = self.metrics
             
-            if since:
-                filtered_metrics = [m for m in filtered_metrics if m.timestamp >= since]
+            if not since:
+                return list(metrics)
             
-            return filtered_metrics
+            if self._chronological:
+                start = bisect.bisect_left(_TimestampView(metrics), since)
+                return list(itertools.islice(metrics, start, None))
+            
+            return [m for m in metrics if m.timestamp >= since]
     
     def get_statistics(self, operation: Optional[str] = None) -> Dict[str, Any]:
         """Get performance statistics."""
-        metrics = self.get_metrics(operation)
-        
-        if not metrics:
-            return {"count": 0}
-        
-        durations = [m.duration for m in metrics]
-        success_count = sum(1 for m in metrics if m.success)
+        key = operation or None
         
-        return {
-            "count": len(metrics),
-            "success_rate": success_count / len(metrics),
-            "avg_duration": sum(durations) / len(durations),
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "total_duration": sum(durations)
-        }
+        with self.lock:
+            stats = self._stats.get(key)
+            if not stats:
+                return {"count": 0}
+            
+            if stats["stale"]:
+                metrics = self.metrics if key is None else self._metrics_by_operation[key]
+                durations = [m.duration for m in metrics]
+                stats["min"] = min(durations)
+                stats["max"] = max(durations)
+                stats["stale"] = False
+            
+            count = stats["count"]
+            return {
+                "count": count,
+                "success_rate": stats["success"] / count,
+                "avg_duration": stats["sum"] / count,
+                "min_duration": stats["min"],
+                "max_duration": stats["max"],
+                "total_duration": stats["sum"]
+            }
     
     def clear_old_metrics(self, older_than: timedelta = timedelta(hours=24)) -> None:
         """Clear metrics older than specified time."""
         cutoff = datetime.now() - older_than
         
         with self.lock:
-            self.metrics = [m for m in self.metrics if m.timestamp >= cutoff]
+            if self._chronological:
+                expired = bisect.bisect_left(_TimestampView(self.metrics), cutoff)
+                for _ in range(expired):
+                    self._drop_oldest()
+                return
+            
+            self.metrics = deque(
+                (m for m in self.metrics if m.timestamp >= cutoff),
+                maxlen=self.max_metrics
+            )
+            self._rebuild_index()
     
     def reset_metrics(self) -> None:
         """Reset all metrics."""
         with self.lock:
             self.metrics.clear()
+            self._metrics_by_operation.clear()
+            self._stats.clear()
+            self._chronological = True
 
 
 class LoggingManager:
@@ -171,6 +369,8 @@ class LoggingManager:
         self.config = config or LoggingConfig()
         self.performance_monitor = PerformanceMonitor()
         self.loggers: Dict[str, logging.Logger] = {}
+        self.handlers: List[logging.Handler] = []
+        self._queue_handler: Optional[_LocalQueueHandler] = None
         self._setup_logging()
     
     def _setup_logging(self) -> None:
@@ -183,19 +383,27 @@ class LoggingManager:
         root_logger = logging.getLogger()
         root_logger.setLevel(self.config.log_level.value)
         
-        # Clear existing handlers
+        # Clear existing handlers, draining any listener a previous manager started
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, _LocalQueueHandler):
+                handler.close()
         root_logger.handlers.clear()
         
         # Add console handler
         if self.config.enable_console:
-            self._add_console_handler(root_logger)
+            self._add_console_handler(self.handlers)
         
         # Add file handler
         if self.config.enable_file:
-            self._add_file_handler(root_logger)
+            self._add_file_handler(self.handlers)
+        
+        # Formatting and disk I/O happen on the listener thread, not the caller's
+        if self.handlers:
+            self._queue_handler = _LocalQueueHandler(queue.SimpleQueue(), *self.handlers)
+            root_logger.addHandler(self._queue_handler)
     
-    def _add_console_handler(self, logger: logging.Logger) -> None:
-        """Add console handler to logger."""
+    def _add_console_handler(self, handlers: List[logging.Handler]) -> None:
+        """Add console handler to the listener's handlers."""
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.config.log_level.value)
         
@@ -207,10 +415,10 @@ class LoggingManager:
                 self.config.date_format
             ))
         
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
-    def _add_file_handler(self, logger: logging.Logger) -> None:
-        """Add rotating file handler to logger."""
+    def _add_file_handler(self, handlers: List[logging.Handler]) -> None:
+        """Add rotating file handler to the listener's handlers."""
         if not self.config.log_dir:
             return
         
@@ -232,7 +440,7 @@ class LoggingManager:
                 self.config.date_format
             ))
         
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     def get_logger(self, name: str) -> logging.Logger:
         """Get or create a logger with the given name."""
@@ -245,8 +453,8 @@ class LoggingManager:
     def set_log_level(self, level: Union[LogLevel, str, int]) -> None:
         """Set the log level for all loggers."""
         if isinstance(level, str):
-            level = LogLevel[level.upper()]
-        elif isinstance(level, int):
+            level = _NAME_TO_LEVEL[level.upper()]
+        elif not isinstance(level, LogLevel):
             level = LogLevel(level)
         
         self.config.log_level = level
@@ -255,7 +463,7 @@ class LoggingManager:
         root_logger = logging.getLogger()
         root_logger.setLevel(level.value)
         
-        for handler in root_logger.handlers:
+        for handler in self.handlers:
             handler.setLevel(level.value)
     
     def enable_debug_mode(self) -> None:
@@ -297,8 +505,20 @@ class LoggingManager:
         # Clear old performance metrics
         self.performance_monitor.clear_old_metrics()
         
-        # Close all handlers
+        self.shutdown()
+    
+    def shutdown(self) -> None:
+        """Flush queued records and close all handlers."""
         root_logger = logging.getLogger()
+        if self._queue_handler is not None:
+            root_logger.removeHandler(self._queue_handler)
+            self._queue_handler.close()
+            self._queue_handler = None
+        
+        for handler in self.handlers:
+            handler.close()
+        self.handlers.clear()
+        
         for handler in root_logger.handlers[:]:
             handler.close()
             root_logger.removeHandler(handler)
@@ -320,14 +540,81 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> LoggingManager:
     """Set up logging with the given configuration."""
     global _logging_manager
     _logging_manager = LoggingManager(config)
+    get_logger.cache_clear()
     return _logging_manager
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name."""
     return get_logging_manager().get_logger(name)
 
 
+def _record_call_metric(operation_name: str, start_time: int, success: bool,
+                        metadata: Dict[str, Any]) -> None:
+    """Record the metric for a call timed by a log_performance wrapper."""
+    metric = PerformanceMetric(
+        operation=operation_name,
+        duration=(time.perf_counter_ns() - start_time) / 1e9,
+        timestamp=datetime.now(),
+        success=success,
+        metadata=metadata
+    )
+    get_logging_manager().performance_monitor.record_metric(metric)
+
+
+def _wrap_async(func, operation_name: str, include_args: bool):
+    """Build the log_performance wrapper for a coroutine function."""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        start_time = time.perf_counter_ns()
+        success = False
+        metadata = {}
+        
+        if include_args:
+            metadata["args_count"] = len(args)
+            metadata["kwargs_keys"] = list(kwargs.keys())
+        
+        try:
+            result = await func(*args, **kwargs)
+            success = True
+            return result
+        except Exception as e:
+            metadata["error"] = str(e)
+            metadata["error_type"] = type(e).__name__
+            raise
+        finally:
+            _record_call_metric(operation_name, start_time, success, metadata)
+    
+    return wrapper
+
+
+def _wrap_sync(func, operation_name: str, include_args: bool):
+    """Build the log_performance wrapper for a regular function."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter_ns()
+        success = False
+        metadata = {}
+        
+        if include_args:
+            metadata["args_count"] = len(args)
+            metadata["kwargs_keys"] = list(kwargs.keys())
+        
+        try:
+            result = func(*args, **kwargs)
+            success = True
+            return result
+        except Exception as e:
+            metadata["error"] = str(e)
+            metadata["error_type"] = type(e).__name__
+            raise
+        finally:
+            _record_call_metric(operation_name, start_time, success, metadata)
+    
+    return wrapper
+
+
 def log_performance(operation_name: str, include_args: bool = False):
     """
     Decorator for logging performance metrics of functions.
@@ -337,70 +624,10 @@ def log_performance(operation_name: str, include_args: bool = False):
         include_args: Whether to include function arguments in metadata
     """
     def decorator(func):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            success = False
-            metadata = {}
-            
-            if include_args:
-                metadata["args_count"] = len(args)
-                metadata["kwargs_keys"] = list(kwargs.keys())
-            
-            try:
-                result = await func(*args, **kwargs)
-                success = True
-                return result
-            except Exception as e:
-                metadata["error"] = str(e)
-                metadata["error_type"] = type(e).__name__
-                raise
-            finally:
-                duration = time.time() - start_time
-                metric = PerformanceMetric(
-                    operation=operation_name,
-                    duration=duration,
-                    timestamp=datetime.now(),
-                    success=success,
-                    metadata=metadata
-                )
-                get_logging_manager().performance_monitor.record_metric(metric)
-        
-        @wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
-            success = False
-            metadata = {}
-            
-            if include_args:
-                metadata["args_count"] = len(args)
-                metadata["kwargs_keys"] = list(kwargs.keys())
-            
-            try:
-                result = func(*args, **kwargs)
-                success = True
-                return result
-            except Exception as e:
-                metadata["error"] = str(e)
-                metadata["error_type"] = type(e).__name__
-                raise
-            finally:
-                duration = time.time() - start_time
-                metric = PerformanceMetric(
-                    operation=operation_name,
-                    duration=duration,
-                    timestamp=datetime.now(),
-                    success=success,
-                    metadata=metadata
-                )
-                get_logging_manager().performance_monitor.record_metric(metric)
-        
-        # Return appropriate wrapper based on function type
-        import asyncio
+        # Only the wrapper matching the function type is built
         if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+            return _wrap_async(func, operation_name, include_args)
+        return _wrap_sync(func, operation_name, include_args)
     
     return decorator
 
@@ -419,7 +646,7 @@ def log_operation(operation_name: str, logger: Optional[logging.Logger] = None,
     if logger is None:
         logger = get_logger("operations")
     
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     extra = extra_data or {}
     extra.update({"operation": operation_name, "operation_start": True})
     
@@ -434,7 +661,7 @@ def log_operation(operation_name: str, logger: Optional[logging.Logger] = None,
         logger.error(f"Operation failed: {operation_name}", extra=extra, exc_info=True)
         raise
     finally:
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_time) / 1e9
         extra.update({
             "operation_end": True,
             "duration": duration,
@@ -519,7 +746,6 @@ def log_function_call(logger: Optional[logging.Logger] = None,
                 raise
         
         # Return appropriate wrapper based on function type
-        import asyncio
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         else:
@@ -534,6 +760,9 @@ def log_mcp_request(request_data: Dict[str, Any], logger: Optional[logging.Logge
     if logger is None:
         logger = get_logger("mcp.requests")
     
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     logger.info("MCP request received", extra={
         "request_type": "mcp",
         "method": request_data.get("method"),
@@ -548,6 +777,9 @@ def log_mcp_response(response_data: Dict[str, Any], duration: float,
     if logger is None:
         logger = get_logger("mcp.responses")
     
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     logger.info("MCP response sent", extra={
         "response_type": "mcp",
         "duration": duration,
@@ -563,6 +795,10 @@ def log_automation_action(action: str, target: str, success: bool,
     if logger is None:
         logger = get_logger("automation")
     
+    level = logging.INFO if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
+    
     extra = {
         "action": action,
         "target": target,
@@ -573,7 +809,6 @@ def log_automation_action(action: str, target: str, success: bool,
     if details:
         extra.update(details)
     
-    level = logging.INFO if success else logging.WARNING
     message = f"Automation action: {action} on {target}"
     
     logger.log(level, message, extra=extra)
\ No newline at end of file
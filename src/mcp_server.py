@@ -296,6 +296,24 @@ class WindowsChatGPTMCPServer:
         include_metrics = arguments.get("include_metrics", True)
         include_logs = arguments.get("include_logs", False)
         
+        debug_info = self._build_debug_info(include_metrics, include_logs)
+        
+        return [TextContent(
+            type="text",
+            text=json.dumps(debug_info, indent=2, default=str)
+        )]
+    
+    def _build_debug_info(self, include_metrics: bool, include_logs: bool) -> Dict[str, Any]:
+        """
+        Collect server debug information.
+        
+        Args:
+            include_metrics: Whether to include performance statistics
+            include_logs: Whether to include log file information
+            
+        Returns:
+            Dictionary of debug information
+        """
         debug_info = {
             "server_info": {
                 "name": "windows-chatgpt-mcp",
@@ -332,10 +350,7 @@ class WindowsChatGPTMCPServer:
         # Add error handler statistics
         debug_info["error_stats"] = self.error_handler.get_error_stats()
         
-        return [TextContent(
-            type="text",
-            text=json.dumps(debug_info, indent=2, default=str)
-        )]
+        return debug_info
     
     @with_error_handling("initialize_server")
     @log_performance("initialize_server")
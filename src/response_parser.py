@@ -42,13 +42,22 @@ class ResponseParser:
     detecting response types, and formatting for MCP protocol consumption.
     """
     
+    # Regex patterns for content detection, compiled once per process
+    code_block_pattern = re.compile(r'```(\w+)?\s*\n(.*?)\n\s*```', re.DOTALL)
+    inline_code_pattern = re.compile(r'`([^`]+)`')
+    
+    # Regex patterns for cleaning and sanitizing text
+    _CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+    _BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+    _HORIZONTAL_SPACE_RE = re.compile(r'[ \t]+')
+    _SCRIPT_TAG_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+    _JAVASCRIPT_URL_RE = re.compile(r'javascript:', re.IGNORECASE)
+    _EVENT_HANDLER_RE = re.compile(r'on\w+\s*=', re.IGNORECASE)
+    
     def __init__(self):
         """Initialize the ResponseParser."""
         self.logger = logging.getLogger(__name__)
         
-        # Regex patterns for content detection
-        self.code_block_pattern = re.compile(r'```(\w+)?\s*\n(.*?)\n\s*```', re.DOTALL)
-        self.inline_code_pattern = re.compile(r'`([^`]+)`')
         self.error_keywords = [
             "sorry", "can't", "cannot", "unable", "error", "apologize",
             "don't understand", "not sure", "unclear", "policy", "restriction"
@@ -135,11 +144,11 @@ class ResponseParser:
             return ""
         
         # Remove control characters except newlines and tabs
-        cleaned = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        cleaned = self._CONTROL_CHARS_RE.sub('', text)
         
         # Normalize whitespace
-        cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned)  # Max 2 consecutive newlines
-        cleaned = re.sub(r'[ \t]+', ' ', cleaned)  # Multiple spaces/tabs to single space
+        cleaned = self._BLANK_LINES_RE.sub('\n\n', cleaned)  # Max 2 consecutive newlines
+        cleaned = self._HORIZONTAL_SPACE_RE.sub(' ', cleaned)  # Multiple spaces/tabs to single space
         
         # Strip leading/trailing whitespace
         cleaned = cleaned.strip()
@@ -164,9 +173,9 @@ class ResponseParser:
         sanitized = content
         
         # Remove potentially harmful patterns
-        sanitized = re.sub(r'<script[^>]*>.*?</script>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-        sanitized = re.sub(r'javascript:', '', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'on\w+\s*=', '', sanitized, flags=re.IGNORECASE)
+        sanitized = self._SCRIPT_TAG_RE.sub('', sanitized)
+        sanitized = self._JAVASCRIPT_URL_RE.sub('', sanitized)
+        sanitized = self._EVENT_HANDLER_RE.sub('', sanitized)
         
         return sanitized
     
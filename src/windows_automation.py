@@ -5,9 +5,11 @@ This module provides functionality to detect, manage, and interact with the Chat
 desktop application using Windows-specific APIs and automation libraries.
 """
 
+import asyncio
+import re
 import time
 import logging
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -32,6 +34,97 @@ pyautogui.PAUSE = 0.1
 
 logger = logging.getLogger(__name__)
 
+# Conversation parsing patterns, compiled once at import time
+_USER_MESSAGE_RE = re.compile(r"Can you|Please|How|What|Why|When|Where|User:")
+_USER_MESSAGE_INITIALS = frozenset("CPHWU")  # First letters of the phrases above
+_ASSISTANT_PREFIX_RE = re.compile(r"(?:Assistant|ChatGPT):")
+_USER_PREFIXES = frozenset({"User:"})
+_ASSISTANT_PREFIXES = frozenset({"Assistant:", "ChatGPT:"})
+_ROLE_PREFIXES = _USER_PREFIXES | _ASSISTANT_PREFIXES
+_UI_LINE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r"^\d+:\d+\s*(AM|PM)$",  # Timestamps
+        r"^(Copy|Share|Like|Dislike)$",  # Action buttons
+        r"^ChatGPT\s*$",  # App name
+        r"^New chat\s*$",  # New chat button
+        r"^\s*\.\.\.\s*$",  # Loading indicators
+    )
+]
+
+
+def _iter_lines_reversed(text: str) -> Iterator[str]:
+    """Yield the lines of text from last to first without splitting it up front."""
+    end = len(text)
+    while end >= 0:
+        start = text.rfind('\n', 0, end)
+        yield text[start + 1:end]
+        end = start
+
+
+def _looks_like_user_message(line: str) -> bool:
+    """Return True if a line looks like a message typed by the user."""
+    # Questions, or lines opening with a common request phrase
+    if line.endswith("?"):
+        return True
+    return line[:1] in _USER_MESSAGE_INITIALS and _USER_MESSAGE_RE.match(line) is not None
+
+
+def _parse_conversation_text(conversation_text: str, max_messages: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse conversation text into (role, content) pairs, oldest first.
+    
+    A non-positive max_messages returns every message.
+    """
+    if max_messages <= 0:
+        # Every message takes at least one character, so this limit is never hit
+        max_messages = len(conversation_text)
+    
+    # Explicit role prefixes take precedence; the question heuristic is
+    # only used for transcripts that carry no prefixes at all
+    has_prefixes = any(prefix in conversation_text for prefix in _ROLE_PREFIXES)
+    
+    messages: List[Tuple[str, str]] = []
+    pending_lines: List[str] = []  # Lines of the message being built, newest first
+    
+    # Walk backwards from the newest line so parsing stops as soon as
+    # the most recent max_messages messages are complete
+    for line in _iter_lines_reversed(conversation_text):
+        line = line.strip()
+        if not line:
+            continue
+        
+        role = None
+        if has_prefixes:
+            # Text up to and including the first colon, empty if there is none
+            head = line[:line.find(':') + 1]
+            if head in _USER_PREFIXES:
+                role = "user"
+            elif head in _ASSISTANT_PREFIXES:
+                role = "assistant"
+            if role:
+                line = line[len(head):].strip()
+        elif _looks_like_user_message(line):
+            role = "user"
+        
+        if line:
+            pending_lines.append(line)
+        
+        # Lines without a role marker continue the message above them
+        if role is None or not pending_lines:
+            continue
+        
+        messages.append((role, "\n".join(reversed(pending_lines))))
+        pending_lines = []
+        if len(messages) >= max_messages:
+            break
+    
+    # Lines before the first role marker default to assistant
+    if pending_lines and len(messages) < max_messages:
+        messages.append(("assistant", "\n".join(reversed(pending_lines))))
+    
+    messages.reverse()
+    return tuple(messages)
+
 
 class WindowState(Enum):
     """Enumeration of possible window states."""
@@ -42,7 +135,7 @@ class WindowState(Enum):
     NOT_FOUND = "not_found"
 
 
-@dataclass
+@dataclass(frozen=True)
 class WindowInfo:
     """Information about a window."""
     handle: int
@@ -879,25 +972,27 @@ class ResponseCapture:
         Returns:
             True if response appears complete, False otherwise
         """
-        if not response_text or len(response_text.strip()) == 0:
+        if not response_text:
+            return False
+        
+        # Strip and lowercase once for all checks below
+        text_stripped = response_text.strip()
+        if not text_stripped:
             return False
         
         # Check for common indicators of incomplete responses
-        incomplete_indicators = [
+        incomplete_indicators = (
             "...",  # Ellipsis indicating more content
             "typing...",  # Typing indicator
             "thinking...",  # Thinking indicator
-        ]
-        
-        text_lower = response_text.lower().strip()
+        )
         
         # Check if text ends with incomplete indicators
-        for indicator in incomplete_indicators:
-            if text_lower.endswith(indicator):
-                return False
+        if text_stripped.lower().endswith(incomplete_indicators):
+            return False
         
         # Check minimum length (very short responses might be incomplete)
-        if len(response_text.strip()) < 10:
+        if len(text_stripped) < 10:
             return False
         
         # If we get here, assume response is complete
@@ -968,23 +1063,12 @@ class ResponseCapture:
         Returns:
             True if line appears to be UI text, False otherwise
         """
-        if not line or len(line.strip()) == 0:
+        line_stripped = line.strip() if line else ""
+        if not line_stripped:
             return True
         
-        # Common UI patterns
-        ui_patterns = [
-            r"^\d+:\d+\s*(AM|PM)$",  # Timestamps
-            r"^(Copy|Share|Like|Dislike)$",  # Action buttons
-            r"^ChatGPT\s*$",  # App name
-            r"^New chat\s*$",  # New chat button
-            r"^\s*\.\.\.\s*$",  # Loading indicators
-        ]
-        
-        import re
-        line_stripped = line.strip()
-        
-        for pattern in ui_patterns:
-            if re.match(pattern, line_stripped, re.IGNORECASE):
+        for pattern in _UI_LINE_PATTERNS:
+            if pattern.match(line_stripped):
                 return True
         
         return False
@@ -1082,7 +1166,7 @@ class ResponseCapture:
                         'role': 'user',
                         'content': line
                     }
-                elif line.startswith('Assistant:') or line.startswith('ChatGPT:'):
+                elif ':' in line and _ASSISTANT_PREFIX_RE.match(line):
                     # Save previous message if exists
                     if current_message:
                         messages.append(current_message)
@@ -1122,19 +1206,7 @@ class ResponseCapture:
         Returns:
             True if line appears to be from user, False otherwise
         """
-        user_indicators = [
-            line.endswith("?"),  # Questions
-            line.startswith("Can you"),
-            line.startswith("Please"),
-            line.startswith("How"),
-            line.startswith("What"),
-            line.startswith("Why"),
-            line.startswith("When"),
-            line.startswith("Where"),
-            line.startswith("User:"),
-        ]
-        
-        return any(user_indicators)
+        return _looks_like_user_message(line)
 
 
 class WindowsAutomationHandler:
@@ -1160,6 +1232,9 @@ class WindowsAutomationHandler:
         self.message_sender = MessageSender(self.window_manager, self.config)
         self.response_capture = ResponseCapture(self.window_manager, self.config)
         
+        # Serializes GUI access: only one operation may drive the window at a time
+        self._gui_lock = asyncio.Lock()
+        
         logger.info("Windows automation handler initialized")
     
     async def send_message_and_get_response(self, message: str, timeout: float = 30) -> str:
@@ -1178,15 +1253,16 @@ class WindowsAutomationHandler:
             AutomationError: If automation operations fail
         """
         try:
-            # Send the message
-            success = self.message_sender.send_message(message)
-            if not success:
-                raise AutomationError("Failed to send message to ChatGPT", "send_message")
-            
-            # Capture the response
-            response = self.response_capture.capture_response(timeout)
-            if response is None:
-                raise AutomationError("Failed to capture response from ChatGPT", "capture_response")
+            async with self._gui_lock:
+                # Send the message
+                success = self.message_sender.send_message(message)
+                if not success:
+                    raise AutomationError("Failed to send message to ChatGPT", "send_message")
+                
+                # Capture the response
+                response = self.response_capture.capture_response(timeout)
+                if response is None:
+                    raise AutomationError("Failed to capture response from ChatGPT", "capture_response")
             
             return response
             
@@ -1205,18 +1281,10 @@ class WindowsAutomationHandler:
             List of conversation messages
         """
         try:
-            window_info = self.window_manager.find_chatgpt_window()
-            if not window_info:
-                logger.warning("ChatGPT window not found for history capture")
-                return []
-            
-            # Focus window
-            if not self.window_manager.focus_window(window_info):
-                logger.warning("Failed to focus window for history capture")
-                return []
-            
-            # Capture current conversation area
-            conversation_text = self._capture_conversation_area(window_info)
+            # Find, focus and capture in a single trip off the event loop
+            loop = asyncio.get_running_loop()
+            async with self._gui_lock:
+                conversation_text = await loop.run_in_executor(None, self._find_focus_capture_sync)
             if not conversation_text:
                 return []
             
@@ -1238,28 +1306,28 @@ class WindowsAutomationHandler:
             True if reset was successful, False otherwise
         """
         try:
-            window_info = self.window_manager.find_chatgpt_window()
-            if not window_info:
-                logger.warning("ChatGPT window not found for conversation reset")
-                return False
-            
-            # Focus window
-            if not self.window_manager.focus_window(window_info):
-                logger.warning("Failed to focus window for conversation reset")
-                return False
-            
-            # Try common keyboard shortcuts for new conversation
-            # Most chat applications use Ctrl+N for new conversation
-            pyautogui.hotkey('ctrl', 'n')
-            time.sleep(1.0)  # Allow time for new conversation to start
-            
-            # Alternative: Try Ctrl+Shift+N
-            if not self._verify_conversation_reset():
-                pyautogui.hotkey('ctrl', 'shift', 'n')
-                time.sleep(1.0)
+            loop = asyncio.get_running_loop()
+            async with self._gui_lock:
+                window_info = await loop.run_in_executor(
+                    None, self._find_and_focus_window, "conversation reset"
+                )
+                if not window_info:
+                    return False
+                
+                # Try common keyboard shortcuts for new conversation
+                # Most chat applications use Ctrl+N for new conversation
+                await loop.run_in_executor(None, pyautogui.hotkey, 'ctrl', 'n')
+                await asyncio.sleep(1.0)  # Allow time for new conversation to start
+                
+                # Alternative: Try Ctrl+Shift+N
+                if not await self._verify_conversation_reset():
+                    await loop.run_in_executor(None, pyautogui.hotkey, 'ctrl', 'shift', 'n')
+                    await asyncio.sleep(1.0)
+                
+                # Verify the reset was successful
+                reset_verified = await self._verify_conversation_reset()
             
-            # Verify the reset was successful
-            if self._verify_conversation_reset():
+            if reset_verified:
                 logger.info("Successfully reset ChatGPT conversation")
                 return True
             else:
@@ -1270,6 +1338,40 @@ class WindowsAutomationHandler:
             logger.error(f"Error resetting conversation: {e}")
             return False
     
+    def _find_and_focus_window(self, operation: str) -> Optional[WindowInfo]:
+        """
+        Locate and focus the ChatGPT window.
+        
+        Args:
+            operation: Name of the calling operation, used in log messages
+            
+        Returns:
+            Focused WindowInfo, or None if the window was not found or focus failed
+        """
+        window_info = self.window_manager.find_chatgpt_window()
+        if not window_info:
+            logger.warning(f"ChatGPT window not found for {operation}")
+            return None
+        
+        if not self.window_manager.focus_window(window_info):
+            logger.warning(f"Failed to focus window for {operation}")
+            return None
+        
+        return window_info
+    
+    def _find_focus_capture_sync(self) -> Optional[str]:
+        """
+        Locate, focus and capture the conversation area in one blocking call.
+        
+        Returns:
+            Raw conversation text or None if any step failed
+        """
+        window_info = self._find_and_focus_window("history capture")
+        if not window_info:
+            return None
+        
+        return self._capture_conversation_area(window_info)
+    
     def _capture_conversation_area(self, window_info: WindowInfo) -> Optional[str]:
         """
         Capture text from the entire conversation area.
@@ -1288,13 +1390,14 @@ class WindowsAutomationHandler:
             logger.error(f"Error capturing conversation area: {e}")
             return None
     
-    def _parse_conversation_history(self, conversation_text: str, max_messages: int) -> List[Dict[str, str]]:
+    @staticmethod
+    def _parse_conversation_history(conversation_text: str, max_messages: int) -> List[Dict[str, str]]:
         """
         Parse conversation text into individual messages.
         
         Args:
             conversation_text: Raw conversation text
-            max_messages: Maximum number of messages to return
+            max_messages: Maximum number of messages to return; non-positive means no limit
             
         Returns:
             List of parsed messages
@@ -1303,61 +1406,10 @@ class WindowsAutomationHandler:
             return []
         
         try:
-            messages = []
-            lines = conversation_text.split('\n')
-            current_message = ""
-            current_role = "assistant"  # Default to assistant
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Check if this is the start of a user message
-                if self._looks_like_user_message(line):
-                    # Save previous message if exists
-                    if current_message:
-                        messages.append({
-                            "role": current_role,
-                            "content": current_message.strip()
-                        })
-                    # Strip the "User:" prefix if present
-                    if line.startswith("User:"):
-                        current_message = line[5:].strip()  # Remove "User:"
-                    else:
-                        current_message = line
-                    current_role = "user"
-                # Check if this is the start of an assistant message
-                elif line.startswith("Assistant:") or line.startswith("ChatGPT:"):
-                    # Save previous message if exists
-                    if current_message:
-                        messages.append({
-                            "role": current_role,
-                            "content": current_message.strip()
-                        })
-                    # Strip the role prefix from the content
-                    if line.startswith("Assistant:"):
-                        current_message = line[10:].strip()  # Remove "Assistant:"
-                    elif line.startswith("ChatGPT:"):
-                        current_message = line[8:].strip()   # Remove "ChatGPT:"
-                    current_role = "assistant"
-                else:
-                    # Continue current message
-                    if current_message:
-                        current_message += "\n" + line
-                    else:
-                        current_message = line
-                        current_role = "assistant"  # Default to assistant
-            
-            # Add the last message
-            if current_message:
-                messages.append({
-                    "role": current_role,
-                    "content": current_message.strip()
-                })
-            
-            # Return most recent messages up to max_messages
-            return messages[-max_messages:] if len(messages) > max_messages else messages
+            return [
+                {"role": role, "content": content}
+                for role, content in _parse_conversation_text(conversation_text, max_messages)
+            ]
             
         except Exception as e:
             logger.error(f"Error parsing conversation history: {e}")
@@ -1373,21 +1425,9 @@ class WindowsAutomationHandler:
         Returns:
             True if line appears to be from user, False otherwise
         """
-        user_indicators = [
-            line.endswith("?"),  # Questions
-            line.startswith("Can you"),
-            line.startswith("Please"),
-            line.startswith("How"),
-            line.startswith("What"),
-            line.startswith("Why"),
-            line.startswith("When"),
-            line.startswith("Where"),
-            line.startswith("User:"),
-        ]
-        
-        return any(user_indicators)
+        return _looks_like_user_message(line)
     
-    def _verify_conversation_reset(self) -> bool:
+    async def _verify_conversation_reset(self) -> bool:
         """
         Verify that the conversation has been reset.
         
@@ -1396,7 +1436,7 @@ class WindowsAutomationHandler:
         """
         try:
             # This is a simplified verification
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
             return True
             
         except Exception as e:
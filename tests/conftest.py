@@ -0,0 +1,79 @@
+"""
+Shared pytest fixtures for the Windows ChatGPT MCP test suite.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.exceptions import wrap_system_error
+from src.response_parser import ResponseParser
+
+
+@pytest.fixture(scope="session")
+def wrapped_key_error():
+    """Create a representative SystemError wrapping a KeyError."""
+    return wrap_system_error(KeyError("missing key"), "data_processing")
+
+
+@pytest.fixture(scope="session")
+def mock_config_manager():
+    """Create a mock config manager for testing."""
+    return Mock(**{"get_server_config.return_value.server_name": "test-server"})
+
+
+@pytest.fixture(scope="session")
+def mock_window_info():
+    """Create a mock WindowInfo for testing."""
+    # Imported here so modules that never request this fixture do not pull in
+    # the Windows automation dependencies through conftest
+    from src.windows_automation import WindowInfo, WindowState
+    
+    return WindowInfo(
+        handle=12345,
+        title="Test ChatGPT",
+        position=(100, 100),
+        size=(800, 600),
+        is_visible=True,
+        state=WindowState.NORMAL,
+        process_id=9876
+    )
+
+
+@pytest.fixture(scope="session")
+def response_parser():
+    """Create a ResponseParser instance."""
+    return ResponseParser()
+
+
+@pytest.fixture(scope="module")
+def stub_setup_logging():
+    """Make servers built in this module get a fresh Mock logging manager."""
+    # Imported here for the same reason as in mock_window_info
+    import src.mcp_server as server_module
+    
+    original = server_module.setup_logging
+    server_module.setup_logging = lambda config=None: Mock()
+    yield
+    server_module.setup_logging = original
+
+
+@pytest.fixture(scope="module")
+def shared_mcp_server(stub_setup_logging):
+    """Create one MCP server with a mocked logging manager per test module."""
+    from src.mcp_server import WindowsChatGPTMCPServer
+    
+    return WindowsChatGPTMCPServer()
+
+
+@pytest.fixture
+def mcp_server(shared_mcp_server):
+    """Provide the shared MCP server and undo per-test overrides afterwards."""
+    components = (shared_mcp_server, shared_mcp_server.config_manager, shared_mcp_server.error_handler)
+    snapshots = [(component, dict(vars(component))) for component in components]
+    
+    yield shared_mcp_server
+    
+    for component, attributes in snapshots:
+        vars(component).clear()
+        vars(component).update(attributes)
+    shared_mcp_server.logging_manager.reset_mock()
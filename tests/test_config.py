@@ -8,8 +8,8 @@ import asyncio
 import json
 import os
 import tempfile
+import itertools
 import unittest
-import uuid
 import shutil
 from unittest.mock import patch, mock_open
 from pathlib import Path
@@ -19,34 +19,113 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from config import ConfigManager, ConfigurationError, WindowDetectionConfig, AutomationConfig
 
+# Config file fixtures, built and serialized once at import time
+_LOADING_FIXTURE = {
+    "window_detection": {
+        "window_title_patterns": ["Test ChatGPT"],
+        "window_class_names": ["TestClass"],
+        "search_timeout": 5.0,
+        "focus_retry_attempts": 2,
+        "focus_retry_delay": 0.5
+    },
+    "automation": {
+        "typing_delay": 0.1,
+        "response_timeout": 20.0,
+        "response_check_interval": 1.0,
+        "max_response_wait_time": 40.0,
+        "clipboard_fallback_threshold": 500,
+        "screenshot_on_error": False
+    },
+    "server": {
+        "server_name": "test-server",
+        "server_version": "0.1.0",
+        "log_level": "DEBUG",
+        "max_concurrent_requests": 3,
+        "request_timeout": 60.0
+    },
+    "chatgpt": {
+        "input_field_selector": "test-input",
+        "response_container_selector": "test-response",
+        "new_chat_button_selector": "test-button",
+        "conversation_history_selector": "test-history",
+        "loading_indicator_selector": "test-loading"
+    }
+}
+_LOADING_FIXTURE_JSON = json.dumps(_LOADING_FIXTURE)
+
+_INVALID_PATTERNS_FIXTURE = {
+    "window_detection": {
+        "window_title_patterns": [],  # Empty patterns should be invalid
+        "window_class_names": ["TestClass"],
+        "search_timeout": 5.0,
+        "focus_retry_attempts": 2,
+        "focus_retry_delay": 0.5
+    }
+}
+_INVALID_PATTERNS_FIXTURE_JSON = json.dumps(_INVALID_PATTERNS_FIXTURE)
+
+_INVALID_TIMEOUTS_FIXTURE = {
+    "window_detection": {
+        "search_timeout": -1.0  # Negative timeout should be invalid
+    },
+    "automation": {
+        "response_timeout": 0.0  # Zero timeout should be invalid
+    }
+}
+_INVALID_TIMEOUTS_FIXTURE_JSON = json.dumps(_INVALID_TIMEOUTS_FIXTURE)
+
+_INVALID_LOG_LEVEL_FIXTURE = {
+    "server": {
+        "log_level": "INVALID_LEVEL"  # Invalid log level
+    }
+}
+_INVALID_LOG_LEVEL_FIXTURE_JSON = json.dumps(_INVALID_LOG_LEVEL_FIXTURE)
+
+_PARTIAL_FIXTURE = {
+    "server": {
+        "server_name": "custom-server"
+    }
+}
+_PARTIAL_FIXTURE_JSON = json.dumps(_PARTIAL_FIXTURE)
+
 
 class TestConfigManager(unittest.TestCase):
     """Test cases for ConfigManager class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests in the class."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls._counter = itertools.count()
+        
+        # Load the default configuration once and reuse it across tests
+        async def prime():
+            manager = ConfigManager(os.path.join(cls.temp_dir, "defaults.json"))
+            await manager.load_config()
+            return manager.config_data
+        
+        cls._default_data = asyncio.run(prime())
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
         # Use unique filename for each test to avoid conflicts
-        unique_id = str(uuid.uuid4())[:8]
-        self.config_path = os.path.join(self.temp_dir, f"test_config_{unique_id}.json")
-        # Ensure no config file exists initially
-        if os.path.exists(self.config_path):
-            os.remove(self.config_path)
+        suffix = next(self._counter)
+        self.config_path = os.path.join(self.temp_dir, f"test_config_{suffix}.json")
         # Create a fresh config manager for each test
         self.config_manager = ConfigManager(self.config_path)
     
+    def _default_manager(self):
+        """Return a manager for this test's path holding the cached defaults."""
+        return ConfigManager.from_data(self.config_path, self._default_data)
+    
     def tearDown(self):
         """Clean up test fixtures."""
-        try:
-            if os.path.exists(self.config_path):
-                os.remove(self.config_path)
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-            # Also clean up any config.json in current directory
-            cwd_config = os.path.join(os.getcwd(), "config.json")
-            if os.path.exists(cwd_config):
-                os.remove(cwd_config)
-        except Exception:
-            pass  # Ignore cleanup errors
+        Path(self.config_path).unlink(missing_ok=True)
     
     def test_default_config_creation(self):
         """Test that default configuration is created when no config file exists."""
@@ -66,41 +145,7 @@ class TestConfigManager(unittest.TestCase):
     
     def test_config_loading_from_file(self):
         """Test loading configuration from existing file."""
-        # Create test config file
-        test_config = {
-            "window_detection": {
-                "window_title_patterns": ["Test ChatGPT"],
-                "window_class_names": ["TestClass"],
-                "search_timeout": 5.0,
-                "focus_retry_attempts": 2,
-                "focus_retry_delay": 0.5
-            },
-            "automation": {
-                "typing_delay": 0.1,
-                "response_timeout": 20.0,
-                "response_check_interval": 1.0,
-                "max_response_wait_time": 40.0,
-                "clipboard_fallback_threshold": 500,
-                "screenshot_on_error": False
-            },
-            "server": {
-                "server_name": "test-server",
-                "server_version": "0.1.0",
-                "log_level": "DEBUG",
-                "max_concurrent_requests": 3,
-                "request_timeout": 60.0
-            },
-            "chatgpt": {
-                "input_field_selector": "test-input",
-                "response_container_selector": "test-response",
-                "new_chat_button_selector": "test-button",
-                "conversation_history_selector": "test-history",
-                "loading_indicator_selector": "test-loading"
-            }
-        }
-        
-        with open(self.config_path, 'w') as f:
-            json.dump(test_config, f)
+        Path(self.config_path).write_text(_LOADING_FIXTURE_JSON)
         
         async def run_test():
             await self.config_manager.load_config()
@@ -123,19 +168,7 @@ class TestConfigManager(unittest.TestCase):
     
     def test_config_validation_invalid_window_patterns(self):
         """Test configuration validation with invalid window patterns."""
-        # Create invalid config
-        invalid_config = {
-            "window_detection": {
-                "window_title_patterns": [],  # Empty patterns should be invalid
-                "window_class_names": ["TestClass"],
-                "search_timeout": 5.0,
-                "focus_retry_attempts": 2,
-                "focus_retry_delay": 0.5
-            }
-        }
-        
-        with open(self.config_path, 'w') as f:
-            json.dump(invalid_config, f)
+        Path(self.config_path).write_text(_INVALID_PATTERNS_FIXTURE_JSON)
         
         async def run_test():
             with self.assertRaises(ConfigurationError):
@@ -145,18 +178,7 @@ class TestConfigManager(unittest.TestCase):
     
     def test_config_validation_invalid_timeouts(self):
         """Test configuration validation with invalid timeout values."""
-        # Create invalid config
-        invalid_config = {
-            "window_detection": {
-                "search_timeout": -1.0  # Negative timeout should be invalid
-            },
-            "automation": {
-                "response_timeout": 0.0  # Zero timeout should be invalid
-            }
-        }
-        
-        with open(self.config_path, 'w') as f:
-            json.dump(invalid_config, f)
+        Path(self.config_path).write_text(_INVALID_TIMEOUTS_FIXTURE_JSON)
         
         async def run_test():
             with self.assertRaises(ConfigurationError):
@@ -166,15 +188,7 @@ class TestConfigManager(unittest.TestCase):
     
     def test_config_validation_invalid_log_level(self):
         """Test configuration validation with invalid log level."""
-        # Create invalid config
-        invalid_config = {
-            "server": {
-                "log_level": "INVALID_LEVEL"  # Invalid log level
-            }
-        }
-        
-        with open(self.config_path, 'w') as f:
-            json.dump(invalid_config, f)
+        Path(self.config_path).write_text(_INVALID_LOG_LEVEL_FIXTURE_JSON)
         
         async def run_test():
             with self.assertRaises(ConfigurationError):
@@ -184,91 +198,91 @@ class TestConfigManager(unittest.TestCase):
     
     def test_get_config_value(self):
         """Test getting configuration values."""
-        async def run_test():
-            # Ensure we start with a fresh config manager and no existing config file
-            self.assertFalse(os.path.exists(self.config_path))
-            await self.config_manager.load_config()
-            
-            # Test getting existing value from default config
-            value = self.config_manager.get_config_value("server", "server_name")
-            self.assertEqual(value, "windows-chatgpt-mcp")
-            
-            # Test getting non-existent value with default
-            value = self.config_manager.get_config_value("nonexistent", "key", "default")
-            self.assertEqual(value, "default")
-            
-            # Test getting non-existent value without default
-            value = self.config_manager.get_config_value("nonexistent", "key")
-            self.assertIsNone(value)
+        self.config_manager = self._default_manager()
         
-        asyncio.run(run_test())
+        # Test getting existing value from default config
+        value = self.config_manager.get_config_value("server", "server_name")
+        self.assertEqual(value, "windows-chatgpt-mcp")
+        
+        # Test getting non-existent value with default
+        value = self.config_manager.get_config_value("nonexistent", "key", "default")
+        self.assertEqual(value, "default")
+        
+        # Test getting non-existent value without default
+        value = self.config_manager.get_config_value("nonexistent", "key")
+        self.assertIsNone(value)
     
     def test_set_config_value(self):
         """Test setting configuration values."""
-        async def run_test():
-            await self.config_manager.load_config()
-            
-            # Set new value
-            self.config_manager.set_config_value("server", "server_name", "new-name")
-            value = self.config_manager.get_config_value("server", "server_name")
-            self.assertEqual(value, "new-name")
-            
-            # Set value in new section
-            self.config_manager.set_config_value("new_section", "new_key", "new_value")
-            value = self.config_manager.get_config_value("new_section", "new_key")
-            self.assertEqual(value, "new_value")
+        self.config_manager = self._default_manager()
         
-        asyncio.run(run_test())
+        # Set new value
+        self.config_manager.set_config_value("server", "server_name", "new-name")
+        value = self.config_manager.get_config_value("server", "server_name")
+        self.assertEqual(value, "new-name")
+        
+        # Set value in new section
+        self.config_manager.set_config_value("new_section", "new_key", "new_value")
+        value = self.config_manager.get_config_value("new_section", "new_key")
+        self.assertEqual(value, "new_value")
     
     def test_window_pattern_management(self):
         """Test window pattern management methods."""
-        async def run_test():
-            await self.config_manager.load_config()
-            
-            # Test adding pattern
-            self.config_manager.add_window_pattern("New Pattern")
-            patterns = self.config_manager.config_data["window_detection"]["window_title_patterns"]
-            self.assertIn("New Pattern", patterns)
-            
-            # Test adding duplicate pattern (should not duplicate)
-            original_length = len(patterns)
-            self.config_manager.add_window_pattern("New Pattern")
-            self.assertEqual(len(patterns), original_length)
-            
-            # Test removing pattern
-            removed = self.config_manager.remove_window_pattern("New Pattern")
-            self.assertTrue(removed)
-            self.assertNotIn("New Pattern", patterns)
-            
-            # Test removing non-existent pattern
-            removed = self.config_manager.remove_window_pattern("Non-existent")
-            self.assertFalse(removed)
+        self.config_manager = self._default_manager()
         
-        asyncio.run(run_test())
+        # Test adding pattern
+        self.config_manager.add_window_pattern("New Pattern")
+        patterns = self.config_manager.config_data["window_detection"]["window_title_patterns"]
+        self.assertIn("New Pattern", patterns)
+        
+        # Test adding duplicate pattern (should not duplicate)
+        original_length = len(patterns)
+        self.config_manager.add_window_pattern("New Pattern")
+        self.assertEqual(len(patterns), original_length)
+        
+        # Test removing pattern
+        removed = self.config_manager.remove_window_pattern("New Pattern")
+        self.assertTrue(removed)
+        self.assertNotIn("New Pattern", patterns)
+        
+        # Test removing non-existent pattern
+        removed = self.config_manager.remove_window_pattern("Non-existent")
+        self.assertFalse(removed)
     
     def test_config_objects_creation(self):
         """Test that configuration objects are created correctly."""
-        async def run_test():
-            await self.config_manager.load_config()
-            
-            # Check that all config objects are created
-            self.assertIsInstance(self.config_manager.window_detection, WindowDetectionConfig)
-            self.assertIsInstance(self.config_manager.automation, AutomationConfig)
-            self.assertIsNotNone(self.config_manager.server)
-            self.assertIsNotNone(self.config_manager.chatgpt)
-            
-            # Check that values are correctly mapped
-            self.assertEqual(
-                self.config_manager.window_detection.search_timeout,
-                self.config_manager.config_data["window_detection"]["search_timeout"]
-            )
+        self.config_manager = self._default_manager()
         
-        asyncio.run(run_test())
+        # Check that all config objects are created
+        self.assertIsInstance(self.config_manager.window_detection, WindowDetectionConfig)
+        self.assertIsInstance(self.config_manager.automation, AutomationConfig)
+        self.assertIsNotNone(self.config_manager.server)
+        self.assertIsNotNone(self.config_manager.chatgpt)
+        
+        # Check that values are correctly mapped
+        self.assertEqual(
+            self.config_manager.window_detection.search_timeout,
+            self.config_manager.config_data["window_detection"]["search_timeout"]
+        )
+    
+    def test_from_data_copies_data(self):
+        """Test that managers built from cached data do not share state."""
+        self.config_manager = self._default_manager()
+        self.config_manager.add_window_pattern("New Pattern")
+        
+        self.assertNotIn(
+            "New Pattern",
+            self._default_data["window_detection"]["window_title_patterns"]
+        )
+        self.assertNotIn(
+            "New Pattern",
+            ConfigManager.DEFAULT_CONFIG["window_detection"]["window_title_patterns"]
+        )
     
     def test_config_save(self):
         """Test configuration saving."""
         async def run_test():
-            await self.config_manager.load_config()
+            self.config_manager = self._default_manager()
             
             # Modify configuration
             self.config_manager.set_config_value("server", "server_name", "modified-name")
@@ -287,15 +301,7 @@ class TestConfigManager(unittest.TestCase):
     
     def test_config_merge_with_defaults(self):
         """Test that partial configuration is merged with defaults."""
-        # Create partial config file
-        partial_config = {
-            "server": {
-                "server_name": "custom-server"
-            }
-        }
-        
-        with open(self.config_path, 'w') as f:
-            json.dump(partial_config, f)
+        Path(self.config_path).write_text(_PARTIAL_FIXTURE_JSON)
         
         async def run_test():
             await self.config_manager.load_config()
@@ -5,6 +5,7 @@ This module contains comprehensive tests for error handling, recovery mechanisms
 and user-friendly error message formatting.
 """
 
+import copy
 import pytest
 import asyncio
 import logging
@@ -24,21 +25,35 @@ from src.exceptions import (
 )
 
 
+# None of the tests assert on timestamp freshness, so one value is shared
+_NOW = datetime.now()
+
+
+@pytest.fixture(scope="session")
+def _proto_handler():
+    """Build a pristine ErrorHandler once for the whole session."""
+    return ErrorHandler(Mock(spec_set=logging.Logger))
+
+
+@pytest.fixture
+def error_handler(_proto_handler):
+    """Create an ErrorHandler instance for testing by cloning the prototype."""
+    handler = copy.copy(_proto_handler)
+    handler.error_stats = {}
+    handler.recovery_strategies = dict(_proto_handler.recovery_strategies)
+    handler.logger = Mock(spec_set=logging.Logger)
+    return handler
+
+
 class TestErrorHandler:
     """Test cases for the ErrorHandler class."""
     
-    @pytest.fixture
-    def error_handler(self):
-        """Create an ErrorHandler instance for testing."""
-        logger = Mock(spec=logging.Logger)
-        return ErrorHandler(logger)
-    
     @pytest.fixture
     def error_context(self):
         """Create an ErrorContext instance for testing."""
         return ErrorContext(
             operation="test_operation",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             attempt_count=1
         )
     
@@ -167,6 +182,13 @@ class TestErrorHandler:
 class TestRetryDecorator:
     """Test cases for the retry decorator."""
     
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        """Stub out retry delays so the retry loop runs without idling."""
+        with patch("src.error_handler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            self.mock_sleep = mock_sleep
+            yield
+    
     @pytest.mark.asyncio
     async def test_successful_execution(self):
         """Test successful execution without retries."""
@@ -188,7 +210,7 @@ class TestRetryDecorator:
         """Test retry behavior on recoverable errors."""
         call_count = 0
         
-        @with_error_handling("test_operation", retry_config=RetryConfig(max_attempts=3, base_delay=0.01))
+        @with_error_handling("test_operation", retry_config=RetryConfig(max_attempts=3))
         async def test_func():
             nonlocal call_count
             call_count += 1
@@ -200,13 +222,15 @@ class TestRetryDecorator:
         
         assert result == "success"
         assert call_count == 3
+        assert self.mock_sleep.await_count == 2
+        self.mock_sleep.assert_awaited_with(RetryConfig().base_delay)
     
     @pytest.mark.asyncio
     async def test_fail_after_max_attempts(self):
         """Test failure after max retry attempts."""
         call_count = 0
         
-        @with_error_handling("test_operation", retry_config=RetryConfig(max_attempts=2, base_delay=0.01))
+        @with_error_handling("test_operation", retry_config=RetryConfig(max_attempts=2))
         async def test_func():
             nonlocal call_count
             call_count += 1
@@ -216,6 +240,7 @@ class TestRetryDecorator:
             await test_func()
         
         assert call_count == 2
+        self.mock_sleep.assert_awaited_once()
     
     @pytest.mark.asyncio
     async def test_no_retry_on_non_recoverable_error(self):
@@ -302,72 +327,34 @@ class TestConvenienceFunctions:
 class TestErrorRecoveryScenarios:
     """Test cases for specific error recovery scenarios."""
     
-    @pytest.fixture
-    def error_handler(self):
-        """Create an ErrorHandler instance for testing."""
-        return ErrorHandler()
-    
-    @pytest.mark.asyncio
-    async def test_connection_error_recovery(self, error_handler):
-        """Test recovery from connection errors."""
-        context = ErrorContext("connect_to_chatgpt", datetime.now())
-        error = ChatGPTConnectionError("ChatGPT not running")
-        
-        result = await error_handler.handle_error(error, context)
-        
-        assert result == "recoverable"
-        assert error_handler.recovery_strategies[ErrorCategory.CONNECTION] == RecoveryStrategy.RETRY_WITH_DELAY
-    
-    @pytest.mark.asyncio
-    async def test_window_error_recovery(self, error_handler):
-        """Test recovery from window errors."""
-        context = ErrorContext("find_window", datetime.now())
-        error = ChatGPTWindowError("Window not found")
-        
-        result = await error_handler.handle_error(error, context)
-        
-        assert result == "recoverable"
-    
-    @pytest.mark.asyncio
-    async def test_timeout_error_recovery(self, error_handler):
-        """Test recovery from timeout errors."""
-        context = ErrorContext("wait_for_response", datetime.now())
-        error = ResponseTimeoutError(30.0)
-        
-        result = await error_handler.handle_error(error, context)
-        
-        assert result == "recoverable"
-        assert error_handler.recovery_strategies[ErrorCategory.TIMEOUT] == RecoveryStrategy.RETRY_WITH_BACKOFF
-    
-    @pytest.mark.asyncio
-    async def test_validation_error_no_recovery(self, error_handler):
-        """Test no recovery for validation errors."""
-        context = ErrorContext("validate_input", datetime.now())
-        error = ValidationError("Invalid message format")
-        
-        result = await error_handler.handle_error(error, context)
-        
-        assert result is None  # No recovery for validation errors
-    
     @pytest.mark.asyncio
-    async def test_configuration_error_no_recovery(self, error_handler):
-        """Test no recovery for configuration errors."""
-        context = ErrorContext("load_config", datetime.now())
-        error = ConfigurationError("Missing config file")
+    @pytest.mark.parametrize("operation, error_factory, expected, expected_strategy", [
+        ("connect_to_chatgpt", lambda: ChatGPTConnectionError("ChatGPT not running"),
+         "recoverable", RecoveryStrategy.RETRY_WITH_DELAY),
+        ("find_window", lambda: ChatGPTWindowError("Window not found"),
+         "recoverable", RecoveryStrategy.RETRY_WITH_DELAY),
+        ("wait_for_response", lambda: ResponseTimeoutError(30.0),
+         "recoverable", RecoveryStrategy.RETRY_WITH_BACKOFF),
+        # No recovery for validation or configuration errors
+        ("validate_input", lambda: ValidationError("Invalid message format"),
+         None, RecoveryStrategy.FAIL_FAST),
+        ("load_config", lambda: ConfigurationError("Missing config file"),
+         None, RecoveryStrategy.FAIL_FAST),
+    ], ids=["connection", "window", "timeout", "validation", "configuration"])
+    async def test_recovery_matrix(self, error_handler, operation, error_factory, expected, expected_strategy):
+        """Test recovery outcome and strategy for each error category."""
+        context = ErrorContext(operation, _NOW)
+        error = error_factory()
         
         result = await error_handler.handle_error(error, context)
         
-        assert result is None  # No recovery for configuration errors
+        assert result == expected
+        assert error_handler.recovery_strategies[error.category] == expected_strategy
 
 
 class TestErrorStatistics:
     """Test cases for error statistics tracking."""
     
-    @pytest.fixture
-    def error_handler(self):
-        """Create an ErrorHandler instance for testing."""
-        return ErrorHandler()
-    
     @pytest.mark.asyncio
     async def test_error_stats_tracking(self, error_handler):
         """Test error statistics tracking."""
@@ -378,20 +365,24 @@ class TestErrorStatistics:
         error2 = AutomationError("Automation failed", "click_button")
         error3 = ChatGPTConnectionError("Another connection error")
         
-        await error_handler.handle_error(error1, context1)
-        await error_handler.handle_error(error2, context2)
-        await error_handler.handle_error(error3, context1)
+        # Stats are updated synchronously inside handle_error, so concurrent
+        # calls cannot interleave their counter updates
+        await asyncio.gather(
+            error_handler.handle_error(error1, context1),
+            error_handler.handle_error(error2, context2),
+            error_handler.handle_error(error3, context1),
+        )
         
-        stats = error_handler.get_error_stats()
+        stats = error_handler.error_stats
         
         # Check connection errors
-        connection_stats = stats["error_stats"]["connection"]["operation1"]
+        connection_stats = stats["connection"]["operation1"]
         assert connection_stats["count"] == 2
         assert connection_stats["recoverable_count"] == 2
         assert connection_stats["non_recoverable_count"] == 0
         
         # Check automation errors
-        automation_stats = stats["error_stats"]["automation"]["operation2"]
+        automation_stats = stats["automation"]["operation2"]
         assert automation_stats["count"] == 1
         assert automation_stats["recoverable_count"] == 1
     
@@ -449,10 +440,10 @@ async def test_jitter_in_retry_delay():
     
     config = RetryConfig(base_delay=1.0, backoff_multiplier=2.0, jitter=True)
     
-    delays = []
-    for _ in range(10):
-        delay = await _calculate_retry_delay(2, config, RecoveryStrategy.RETRY_WITH_BACKOFF)
-        delays.append(delay)
+    delays = await asyncio.gather(*(
+        _calculate_retry_delay(2, config, RecoveryStrategy.RETRY_WITH_BACKOFF)
+        for _ in range(10)
+    ))
     
     # With jitter, delays should vary
     assert len(set(delays)) > 1  # Should have different values
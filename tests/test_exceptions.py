@@ -12,23 +12,79 @@ from src.exceptions import (
     ErrorCategory, MCPError, ChatGPTConnectionError, ChatGPTWindowError,
     AutomationError, ResponseTimeoutError, ConfigurationError, ValidationError,
     ProtocolError, SystemError, create_window_not_found_error,
-    create_automation_timeout_error, create_invalid_message_error, wrap_system_error
+    create_automation_timeout_error, create_invalid_message_error
 )
 
 
+# Expected start of the generated user message for each category
+USER_MSG_PREFIXES = {
+    ErrorCategory.CONNECTION: "Unable to connect to ChatGPT",
+    ErrorCategory.AUTOMATION: "Failed to interact with ChatGPT interface",
+    ErrorCategory.PROTOCOL: "Communication error occurred",
+    ErrorCategory.CONFIGURATION: "Configuration error",
+    ErrorCategory.WINDOW: "Cannot find or access ChatGPT window",
+    ErrorCategory.TIMEOUT: "Operation timed out",
+    ErrorCategory.VALIDATION: "Invalid input provided",
+    ErrorCategory.SYSTEM: "An unexpected error occurred",
+}
+
+# create_invalid_message_error keeps the first 100 characters of long messages
+EXPECTED_TRUNCATED = "a" * 100 + "..."
+
+ERROR_CLASSES = [
+    ChatGPTConnectionError, ChatGPTWindowError, AutomationError,
+    ResponseTimeoutError, ConfigurationError, ValidationError,
+    ProtocolError, SystemError
+]
+
+# Minimal constructors for error classes that do not take a single message
+ERROR_BUILDERS = {
+    AutomationError: lambda: AutomationError("Test error", "test_operation"),
+    ResponseTimeoutError: lambda: ResponseTimeoutError(30.0),
+}
+
+
+def build_error(error_class):
+    """Create an instance of error_class with minimal required parameters."""
+    builder = ERROR_BUILDERS.get(error_class)
+    return builder() if builder else error_class("Test error")
+
+
+FULL_ERROR_DETAILS = {"key": "value", "number": 42}
+
+
+@pytest.fixture(scope="module")
+def full_mcp_error():
+    """Create a fully specified MCPError shared by read-only tests."""
+    return MCPError(
+        message="Technical error",
+        category=ErrorCategory.CONNECTION,
+        details=dict(FULL_ERROR_DETAILS),
+        recoverable=True,
+        user_message="Custom user message"
+    )
+
+
+@pytest.fixture(scope="session")
+def error_categories():
+    """All ErrorCategory members, iterated once per session."""
+    return tuple(ErrorCategory)
+
+
 class TestErrorCategory:
     """Test cases for ErrorCategory enum."""
     
-    def test_error_categories_exist(self):
+    def test_error_categories_exist(self, error_categories):
         """Test that all expected error categories exist."""
-        expected_categories = [
-            "connection", "automation", "protocol", "configuration",
-            "window", "timeout", "validation", "system"
-        ]
-        
-        for category in expected_categories:
-            assert hasattr(ErrorCategory, category.upper())
-            assert ErrorCategory[category.upper()].value == category
+        expected = {
+            name.upper(): name for name in (
+                "connection", "automation", "protocol", "configuration",
+                "window", "timeout", "validation", "system"
+            )
+        }
+        members = {category.name: category.value for category in error_categories}
+        
+        assert expected.items() <= members.items()
 
 
 class TestMCPError:
@@ -44,78 +100,113 @@ class TestMCPError:
         assert error.recoverable is False
         assert error.user_message == "An unexpected error occurred. Please try again."
     
-    def test_full_initialization(self):
+    def test_full_initialization(self, full_mcp_error):
         """Test MCPError initialization with all parameters."""
-        details = {"key": "value", "number": 42}
-        error = MCPError(
-            message="Technical error",
-            category=ErrorCategory.CONNECTION,
-            details=details,
-            recoverable=True,
-            user_message="Custom user message"
-        )
+        error = full_mcp_error
         
         assert str(error) == "Technical error"
         assert error.category == ErrorCategory.CONNECTION
-        assert error.details == details
+        assert error.details == FULL_ERROR_DETAILS
         assert error.recoverable is True
         assert error.user_message == "Custom user message"
     
-    def test_user_message_generation(self):
+    @pytest.mark.parametrize("category", list(USER_MSG_PREFIXES), ids=lambda c: c.value)
+    def test_user_message_generation(self, category):
         """Test automatic user message generation for different categories."""
-        test_cases = [
-            (ErrorCategory.CONNECTION, "Unable to connect to ChatGPT"),
-            (ErrorCategory.AUTOMATION, "Failed to interact with ChatGPT interface"),
-            (ErrorCategory.PROTOCOL, "Communication error occurred"),
-            (ErrorCategory.CONFIGURATION, "Configuration error"),
-            (ErrorCategory.WINDOW, "Cannot find or access ChatGPT window"),
-            (ErrorCategory.TIMEOUT, "Operation timed out"),
-            (ErrorCategory.VALIDATION, "Invalid input provided"),
-            (ErrorCategory.SYSTEM, "An unexpected error occurred")
-        ]
-        
-        for category, expected_text in test_cases:
-            error = MCPError("Technical message", category=category)
-            assert expected_text in error.user_message
+        error = MCPError("Technical message", category=category)
+        assert error.user_message.startswith(USER_MSG_PREFIXES[category])
     
-    def test_to_dict(self):
+    def test_to_dict(self, full_mcp_error):
         """Test conversion to dictionary."""
-        details = {"context": "test"}
-        error = MCPError(
-            message="Test error",
-            category=ErrorCategory.AUTOMATION,
-            details=details,
-            recoverable=True,
-            user_message="User message"
-        )
+        result = full_mcp_error.to_dict()
         
-        result = error.to_dict()
-        
-        expected_keys = ["error_type", "message", "category", "details", "recoverable", "user_message"]
-        for key in expected_keys:
-            assert key in result
+        expected_keys = {"error_type", "message", "category", "details", "recoverable", "user_message"}
+        assert expected_keys <= result.keys()
         
         assert result["error_type"] == "MCPError"
-        assert result["message"] == "Test error"
-        assert result["category"] == "automation"
-        assert result["details"] == details
+        assert result["message"] == "Technical error"
+        assert result["category"] == "connection"
+        assert result["details"] == FULL_ERROR_DETAILS
         assert result["recoverable"] is True
-        assert result["user_message"] == "User message"
+        assert result["user_message"] == "Custom user message"
 
 
-class TestChatGPTConnectionError:
-    """Test cases for ChatGPTConnectionError."""
+ERROR_CASES = [
+    pytest.param(
+        lambda: ChatGPTConnectionError("Connection failed", details={"process_id": 1234}),
+        "Connection failed", True, ErrorCategory.CONNECTION, True, "Cannot connect to ChatGPT",
+        {"process_id": 1234},
+        id="connection"
+    ),
+    pytest.param(
+        lambda: ChatGPTWindowError("Window not found", details={"search_patterns": ["ChatGPT", "OpenAI"]}),
+        "Window not found", True, ErrorCategory.WINDOW, True, "Cannot find ChatGPT window",
+        {"search_patterns": ["ChatGPT", "OpenAI"]},
+        id="window"
+    ),
+    pytest.param(
+        lambda: AutomationError("Click failed", "click_button", details={"coordinates": (100, 200)}),
+        "Click failed", True, ErrorCategory.AUTOMATION, True, "Failed to click_button",
+        {"operation": "click_button", "coordinates": (100, 200)},
+        id="automation"
+    ),
+    pytest.param(
+        lambda: ResponseTimeoutError(30.5, details={"request_id": "123"}),
+        "Response timeout after 30.5 seconds", False, ErrorCategory.TIMEOUT, True, "30.5 seconds",
+        {"timeout_duration": 30.5, "request_id": "123"},
+        id="timeout"
+    ),
+    pytest.param(
+        lambda: ConfigurationError("Config missing", config_key="api_key", details={"file_path": "/path/to/config"}),
+        "Config missing", True, ErrorCategory.CONFIGURATION, False, "Configuration error",
+        {"config_key": "api_key", "file_path": "/path/to/config"},
+        id="configuration"
+    ),
+    pytest.param(
+        lambda: ValidationError("Invalid format", field="email", value="invalid-email"),
+        "Invalid format", True, ErrorCategory.VALIDATION, False, "Invalid input: Invalid format",
+        {"field": "email", "value": "invalid-email"},
+        id="validation"
+    ),
+    pytest.param(
+        lambda: ProtocolError("Protocol error", request_id="req-123", details={"method": "send_message"}),
+        "Protocol error", True, ErrorCategory.PROTOCOL, True, "Communication error occurred",
+        {"request_id": "req-123", "method": "send_message"},
+        id="protocol"
+    ),
+    pytest.param(
+        lambda: SystemError(
+            "System error occurred",
+            original_exception=ValueError("Original error"),
+            details={"context": "test_function"}
+        ),
+        "System error occurred", True, ErrorCategory.SYSTEM, False, "unexpected system error",
+        {"original_exception": "Original error", "exception_type": "ValueError", "context": "test_function"},
+        id="system"
+    ),
+]
+
+
+class TestErrorInitialization:
+    """Test cases for initialization of the specific error classes."""
     
-    def test_initialization(self):
-        """Test ChatGPTConnectionError initialization."""
-        details = {"process_id": 1234}
-        error = ChatGPTConnectionError("Connection failed", details=details)
-        
-        assert str(error) == "Connection failed"
-        assert error.category == ErrorCategory.CONNECTION
+    @pytest.mark.parametrize("factory,message,exact,category,recoverable,user_message,details", ERROR_CASES)
+    def test_initialization(self, factory, message, exact, category, recoverable, user_message, details):
+        """Test error message, category, details, recoverability and user message."""
+        error = factory()
+        
+        if exact:
+            assert str(error) == message
+        else:
+            assert message in str(error)
+        assert error.category == category
         assert error.details == details
-        assert error.recoverable is True
-        assert "Cannot connect to ChatGPT" in error.user_message
+        assert error.recoverable is recoverable
+        assert user_message in error.user_message
+
+
+class TestChatGPTConnectionError:
+    """Test cases for ChatGPTConnectionError."""
     
     def test_default_user_message(self):
         """Test default user message for connection errors."""
@@ -125,36 +216,9 @@ class TestChatGPTConnectionError:
         assert "ensure ChatGPT is running" in error.user_message
 
 
-class TestChatGPTWindowError:
-    """Test cases for ChatGPTWindowError."""
-    
-    def test_initialization(self):
-        """Test ChatGPTWindowError initialization."""
-        details = {"search_patterns": ["ChatGPT", "OpenAI"]}
-        error = ChatGPTWindowError("Window not found", details=details)
-        
-        assert str(error) == "Window not found"
-        assert error.category == ErrorCategory.WINDOW
-        assert error.details == details
-        assert error.recoverable is True
-        assert "Cannot find ChatGPT window" in error.user_message
-
-
 class TestAutomationError:
     """Test cases for AutomationError."""
     
-    def test_initialization(self):
-        """Test AutomationError initialization."""
-        details = {"coordinates": (100, 200)}
-        error = AutomationError("Click failed", "click_button", details=details)
-        
-        assert str(error) == "Click failed"
-        assert error.category == ErrorCategory.AUTOMATION
-        assert error.details["operation"] == "click_button"
-        assert error.details["coordinates"] == (100, 200)
-        assert error.recoverable is True
-        assert "Failed to click_button" in error.user_message
-    
     def test_operation_in_details(self):
         """Test that operation is added to details."""
         error = AutomationError("Test error", "send_message")
@@ -165,19 +229,6 @@ class TestAutomationError:
 class TestResponseTimeoutError:
     """Test cases for ResponseTimeoutError."""
     
-    def test_initialization(self):
-        """Test ResponseTimeoutError initialization."""
-        timeout_duration = 30.5
-        details = {"request_id": "123"}
-        error = ResponseTimeoutError(timeout_duration, details=details)
-        
-        assert f"Response timeout after {timeout_duration} seconds" in str(error)
-        assert error.category == ErrorCategory.TIMEOUT
-        assert error.details["timeout_duration"] == timeout_duration
-        assert error.details["request_id"] == "123"
-        assert error.recoverable is True
-        assert f"{timeout_duration} seconds" in error.user_message
-    
     def test_timeout_in_user_message(self):
         """Test timeout duration appears in user message."""
         error = ResponseTimeoutError(45.0)
@@ -189,18 +240,6 @@ class TestResponseTimeoutError:
 class TestConfigurationError:
     """Test cases for ConfigurationError."""
     
-    def test_initialization(self):
-        """Test ConfigurationError initialization."""
-        details = {"file_path": "/path/to/config"}
-        error = ConfigurationError("Config missing", config_key="api_key", details=details)
-        
-        assert str(error) == "Config missing"
-        assert error.category == ErrorCategory.CONFIGURATION
-        assert error.details["config_key"] == "api_key"
-        assert error.details["file_path"] == "/path/to/config"
-        assert error.recoverable is False
-        assert "Configuration error" in error.user_message
-    
     def test_config_key_in_details(self):
         """Test that config_key is added to details when provided."""
         error = ConfigurationError("Missing setting", config_key="timeout")
@@ -217,17 +256,6 @@ class TestConfigurationError:
 class TestValidationError:
     """Test cases for ValidationError."""
     
-    def test_initialization(self):
-        """Test ValidationError initialization."""
-        error = ValidationError("Invalid format", field="email", value="invalid-email")
-        
-        assert str(error) == "Invalid format"
-        assert error.category == ErrorCategory.VALIDATION
-        assert error.details["field"] == "email"
-        assert error.details["value"] == "invalid-email"
-        assert error.recoverable is False
-        assert "Invalid input: Invalid format" in error.user_message
-    
     def test_optional_parameters(self):
         """Test ValidationError with optional parameters."""
         error = ValidationError("General validation error")
@@ -246,18 +274,6 @@ class TestValidationError:
 class TestProtocolError:
     """Test cases for ProtocolError."""
     
-    def test_initialization(self):
-        """Test ProtocolError initialization."""
-        details = {"method": "send_message"}
-        error = ProtocolError("Protocol error", request_id="req-123", details=details)
-        
-        assert str(error) == "Protocol error"
-        assert error.category == ErrorCategory.PROTOCOL
-        assert error.details["request_id"] == "req-123"
-        assert error.details["method"] == "send_message"
-        assert error.recoverable is True
-        assert "Communication error occurred" in error.user_message
-    
     def test_request_id_in_details(self):
         """Test that request_id is added to details when provided."""
         error = ProtocolError("Test error", request_id="abc-123")
@@ -268,20 +284,6 @@ class TestProtocolError:
 class TestSystemError:
     """Test cases for SystemError."""
     
-    def test_initialization(self):
-        """Test SystemError initialization."""
-        original_exception = ValueError("Original error")
-        details = {"context": "test_function"}
-        error = SystemError("System error occurred", original_exception=original_exception, details=details)
-        
-        assert str(error) == "System error occurred"
-        assert error.category == ErrorCategory.SYSTEM
-        assert error.details["original_exception"] == "Original error"
-        assert error.details["exception_type"] == "ValueError"
-        assert error.details["context"] == "test_function"
-        assert error.recoverable is False
-        assert "unexpected system error" in error.user_message
-    
     def test_without_original_exception(self):
         """Test SystemError without original exception."""
         error = SystemError("General system error")
@@ -301,14 +303,40 @@ class TestSystemError:
 class TestConvenienceFunctions:
     """Test cases for convenience functions."""
     
-    def test_create_window_not_found_error(self):
-        """Test create_window_not_found_error function."""
-        search_patterns = ["ChatGPT", "OpenAI ChatGPT"]
-        error = create_window_not_found_error(search_patterns)
-        
-        assert isinstance(error, ChatGPTWindowError)
-        assert "window not found" in str(error)
-        assert error.details["search_patterns"] == search_patterns
+    @pytest.mark.parametrize("factory,expected_type,expected_substrings,expected_details", [
+        pytest.param(
+            lambda: create_window_not_found_error(["ChatGPT", "OpenAI ChatGPT"]),
+            ChatGPTWindowError, ["window not found"],
+            {"search_patterns": ["ChatGPT", "OpenAI ChatGPT"]},
+            id="window_not_found"
+        ),
+        pytest.param(
+            lambda: create_automation_timeout_error("click_button", 5.0),
+            AutomationError, ["click_button", "timed out after 5.0 seconds"],
+            {"operation": "click_button", "timeout": 5.0},
+            id="automation_timeout"
+        ),
+        pytest.param(
+            # Message longer than 100 characters is truncated
+            lambda: create_invalid_message_error("a" * 150, "too long"),
+            ValidationError, ["Invalid message: too long"],
+            {"field": "message", "value": EXPECTED_TRUNCATED},
+            id="invalid_message_long"
+        ),
+        pytest.param(
+            lambda: create_invalid_message_error("short", "invalid format"),
+            ValidationError, ["Invalid message: invalid format"],
+            {"field": "message", "value": "short"},
+            id="invalid_message_short"
+        ),
+    ])
+    def test_create_error(self, factory, expected_type, expected_substrings, expected_details):
+        """Test the create_* convenience functions."""
+        error = factory()
+        
+        assert isinstance(error, expected_type)
+        assert all(substring in str(error) for substring in expected_substrings)
+        assert expected_details.items() <= error.details.items()
     
     def test_create_window_not_found_error_no_patterns(self):
         """Test create_window_not_found_error without search patterns."""
@@ -317,44 +345,14 @@ class TestConvenienceFunctions:
         assert isinstance(error, ChatGPTWindowError)
         assert "search_patterns" not in error.details
     
-    def test_create_automation_timeout_error(self):
-        """Test create_automation_timeout_error function."""
-        error = create_automation_timeout_error("click_button", 5.0)
-        
-        assert isinstance(error, AutomationError)
-        assert "click_button" in str(error)
-        assert "timed out after 5.0 seconds" in str(error)
-        assert error.details["operation"] == "click_button"
-        assert error.details["timeout"] == 5.0
-    
-    def test_create_invalid_message_error(self):
-        """Test create_invalid_message_error function."""
-        long_message = "a" * 150  # Message longer than 100 characters
-        error = create_invalid_message_error(long_message, "too long")
-        
-        assert isinstance(error, ValidationError)
-        assert "Invalid message: too long" in str(error)
-        assert error.details["field"] == "message"
-        assert error.details["value"].endswith("...")  # Should be truncated
-        assert len(error.details["value"]) == 103  # 100 + "..."
-    
-    def test_create_invalid_message_error_short(self):
-        """Test create_invalid_message_error with short message."""
-        short_message = "short"
-        error = create_invalid_message_error(short_message, "invalid format")
-        
-        assert error.details["value"] == short_message  # Should not be truncated
-    
-    def test_wrap_system_error(self):
+    def test_wrap_system_error(self, wrapped_key_error):
         """Test wrap_system_error function."""
-        original = KeyError("missing key")
-        context = "data_processing"
-        error = wrap_system_error(original, context)
+        error = wrapped_key_error
         
         assert isinstance(error, SystemError)
         assert "System error in data_processing" in str(error)
         assert "missing key" in str(error)
-        assert error.details["context"] == context
+        assert error.details["context"] == "data_processing"
         assert error.details["original_exception"] == "'missing key'"  # KeyError string representation includes quotes
         assert error.details["exception_type"] == "KeyError"
 
@@ -362,46 +360,32 @@ class TestConvenienceFunctions:
 class TestErrorInheritance:
     """Test cases for error inheritance and polymorphism."""
     
-    def test_all_errors_inherit_from_mcp_error(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("error_class", ERROR_CLASSES, ids=lambda cls: cls.__name__)
+    def test_all_errors_inherit_from_mcp_error(self, error_class):
         """Test that all custom errors inherit from MCPError."""
-        error_classes = [
-            ChatGPTConnectionError, ChatGPTWindowError, AutomationError,
-            ResponseTimeoutError, ConfigurationError, ValidationError,
-            ProtocolError, SystemError
-        ]
+        error = build_error(error_class)
         
-        for error_class in error_classes:
-            # Create instance with minimal required parameters
-            if error_class == AutomationError:
-                error = error_class("Test error", "test_operation")
-            elif error_class == ResponseTimeoutError:
-                error = error_class(30.0)
-            else:
-                error = error_class("Test error")
-            
-            assert isinstance(error, MCPError)
-            assert isinstance(error, Exception)
+        assert isinstance(error, MCPError)
+        assert isinstance(error, Exception)
+        assert isinstance(error.to_dict(), dict)
     
-    def test_error_polymorphism(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("error", [
+        pytest.param(ChatGPTConnectionError("Connection failed"), id="connection"),
+        pytest.param(AutomationError("Automation failed", "click"), id="automation"),
+        pytest.param(ValidationError("Invalid input"), id="validation"),
+        pytest.param(SystemError("System error"), id="system"),
+    ])
+    def test_error_polymorphism(self, error):
         """Test that errors can be handled polymorphically."""
-        errors = [
-            ChatGPTConnectionError("Connection failed"),
-            AutomationError("Automation failed", "click"),
-            ValidationError("Invalid input"),
-            SystemError("System error")
-        ]
+        # Should be able to call MCPError methods
+        assert {"to_dict", "user_message", "category", "recoverable"} <= set(dir(error))
         
-        for error in errors:
-            # Should be able to call MCPError methods
-            assert hasattr(error, 'to_dict')
-            assert hasattr(error, 'user_message')
-            assert hasattr(error, 'category')
-            assert hasattr(error, 'recoverable')
-            
-            # Should be able to convert to dict
-            error_dict = error.to_dict()
-            assert isinstance(error_dict, dict)
-            assert "error_type" in error_dict
+        # Should be able to convert to dict
+        error_dict = error.to_dict()
+        assert isinstance(error_dict, dict)
+        assert "error_type" in error_dict
 
 
 if __name__ == "__main__":
@@ -97,6 +97,15 @@ class TestStructuredFormatter:
         assert data["line"] == 42
         assert "timestamp" in data
     
+    def test_timestamp_matches_isoformat(self, formatter, log_record):
+        """Test that cached timestamps render like datetime.isoformat()."""
+        base = float(int(time.time()))
+        
+        for offset in (0.0, 0.25, 0.123456, 0.9999996, 1.5):
+            log_record.created = base + offset
+            data = json.loads(formatter.format(log_record))
+            assert data["timestamp"] == datetime.fromtimestamp(base + offset).isoformat()
+    
     def test_extra_fields(self, formatter, log_record):
         """Test formatting with extra fields."""
         log_record.custom_field = "custom_value"
@@ -107,6 +116,8 @@ class TestStructuredFormatter:
         
         assert data["custom_field"] == "custom_value"
         assert data["operation"] == "test_operation"
+        assert "msg" not in data
+        assert "levelno" not in data
     
     def test_exception_formatting(self, formatter, log_record):
         """Test formatting with exception info."""
@@ -121,6 +132,23 @@ class TestStructuredFormatter:
         
         assert "exception" in data
         assert "ValueError: Test exception" in data["exception"]
+    
+    def test_formatting_without_orjson(self, formatter, log_record):
+        """Test that the stdlib fallback encodes entries like the orjson path."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        metric = PerformanceMetric("op", 0.5, when, True)
+        log_record.details = {"path": Path("/tmp/log"), "count": 3, "when": when, "metric": metric}
+        
+        with patch('src.logging_config.orjson', None):
+            formatted = formatter.format(log_record)
+        data = json.loads(formatted)
+        
+        assert data["message"] == "Test message"
+        assert data["details"]["count"] == 3
+        assert data["details"]["path"] == str(Path("/tmp/log"))
+        assert data["details"]["when"] == str(when)
+        assert data["details"]["metric"] == str(metric)
+        assert json.loads(formatter.format(log_record)) == data
 
 
 class TestPerformanceMonitor:
@@ -152,6 +180,14 @@ class TestPerformanceMonitor:
         assert metrics[0].duration == 1.5
         assert metrics[0].success is True
     
+    def test_metric_defaults(self):
+        """Test that metrics default to empty metadata and carry no instance dict."""
+        metric = PerformanceMetric("op", 1.0, datetime.now(), True)
+        
+        assert metric.metadata == {}
+        assert metric == PerformanceMetric("op", 1.0, metric.timestamp, True, {})
+        assert not hasattr(metric, "__dict__")
+    
     def test_get_metrics_filtering(self, monitor):
         """Test filtering metrics by operation and time."""
         now = datetime.now()
@@ -216,6 +252,61 @@ class TestPerformanceMonitor:
         assert len(remaining_metrics) == 1
         assert remaining_metrics[0].operation == "op1"
     
+    def test_time_queries_on_chronological_metrics(self, monitor):
+        """Test time filtering and clearing when metrics arrive in timestamp order."""
+        now = datetime.now()
+        for hours, operation in [(30, "op1"), (26, "op2"), (2, "op1"), (0, "op2")]:
+            monitor.record_metric(
+                PerformanceMetric(operation, float(hours), now - timedelta(hours=hours), True)
+            )
+        
+        recent = monitor.get_metrics(since=now - timedelta(hours=3))
+        assert [m.duration for m in recent] == [2.0, 0.0]
+        assert [m.duration for m in monitor.get_metrics("op2", since=now - timedelta(hours=27))] == [26.0, 0.0]
+        
+        monitor.clear_old_metrics()
+        
+        assert [m.duration for m in monitor.get_metrics()] == [2.0, 0.0]
+        assert [m.duration for m in monitor.get_metrics("op1")] == [2.0]
+        assert monitor.get_statistics()["max_duration"] == 2.0
+        assert monitor.get_statistics("op2")["count"] == 1
+    
+    def test_max_metrics_evicts_oldest(self):
+        """Test that the oldest metrics are dropped once the limit is reached."""
+        monitor = PerformanceMonitor(max_metrics=3)
+        now = datetime.now()
+        
+        for i, operation in enumerate(["op1", "op2", "op1", "op2", "op2"]):
+            monitor.record_metric(PerformanceMetric(operation, float(i), now, True))
+        
+        assert [m.duration for m in monitor.get_metrics()] == [2.0, 3.0, 4.0]
+        assert [m.duration for m in monitor.get_metrics("op1")] == [2.0]
+        assert [m.duration for m in monitor.get_metrics("op2")] == [3.0, 4.0]
+    
+    def test_statistics_follow_eviction(self):
+        """Test that statistics only cover the retained metrics."""
+        monitor = PerformanceMonitor(max_metrics=3)
+        now = datetime.now()
+        
+        for i, operation in enumerate(["op1", "op2", "op1", "op2", "op2"]):
+            monitor.record_metric(PerformanceMetric(operation, float(i), now, i != 3))
+        
+        stats = monitor.get_statistics()
+        assert stats["count"] == 3
+        assert stats["min_duration"] == 2.0
+        assert stats["max_duration"] == 4.0
+        assert stats["total_duration"] == 9.0
+        
+        op2_stats = monitor.get_statistics("op2")
+        assert op2_stats["count"] == 2
+        assert op2_stats["success_rate"] == 0.5
+        assert op2_stats["min_duration"] == 3.0
+        
+        monitor.record_metric(PerformanceMetric("op3", 5.0, now, True))
+        monitor.record_metric(PerformanceMetric("op3", 6.0, now, True))
+        assert monitor.get_statistics("op1") == {"count": 0}
+        assert monitor.get_statistics("op2")["count"] == 1
+    
     def test_reset_metrics(self, monitor, sample_metric):
         """Test resetting all metrics."""
         monitor.record_metric(sample_metric)
@@ -293,6 +384,7 @@ class TestLoggingManager:
         # Test with int
         manager.set_log_level(logging.DEBUG)
         assert manager.config.log_level == LogLevel.DEBUG
+        assert manager.config.log_level == logging.DEBUG
     
     def test_enable_debug_mode(self, config):
         """Test enabling debug mode."""
@@ -313,6 +405,26 @@ class TestLoggingManager:
         assert log_dir.exists()
         assert log_dir.is_dir()
     
+    def test_records_written_by_listener(self, config):
+        """Test that queued records reach the log file once the manager shuts down."""
+        config.enable_console = False
+        manager = LoggingManager(config)
+        logger = manager.get_logger("test.queue")
+        
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.error("Failed %s", "operation", exc_info=True, extra={"request_id": 7})
+        manager.shutdown()
+        
+        log_file = Path(config.log_dir) / "windows_chatgpt_mcp.log"
+        entry = json.loads(log_file.read_text(encoding="utf-8").splitlines()[-1])
+        assert entry["message"] == "Failed operation"
+        assert entry["request_id"] == 7
+        assert "ValueError: boom" in entry["exception"]
+        assert not manager.handlers
+        assert not logging.getLogger().handlers
+    
     @patch('platform.platform')
     @patch('platform.python_version')
     @patch('psutil.cpu_count')
@@ -574,6 +686,19 @@ class TestConvenienceFunctions:
             assert call_args[1]["extra"]["target"] == "button"
             assert call_args[1]["extra"]["success"] is True
             assert call_args[1]["extra"]["coordinates"] == (100, 200)
+    
+    def test_disabled_logger_skips_logging(self):
+        """Test that convenience functions return early when the level is disabled."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+        
+        log_mcp_request({"method": "call_tool", "id": "123"}, logger=mock_logger)
+        log_mcp_response({"result": "success"}, 1.5, logger=mock_logger)
+        log_automation_action("click", "button", success=False, logger=mock_logger)
+        
+        mock_logger.info.assert_not_called()
+        mock_logger.log.assert_not_called()
+        mock_logger.isEnabledFor.assert_called_with(logging.WARNING)
 
 
 class TestGlobalFunctions:
@@ -597,6 +722,15 @@ class TestGlobalFunctions:
         
         assert isinstance(logger, logging.Logger)
         assert logger.name == "test.module"
+    
+    def test_get_logger_cache_cleared_on_setup(self):
+        """Test that setup_logging registers cached loggers with the new manager."""
+        get_logger("test.cached")
+        manager = setup_logging(LoggingConfig(enable_file=False))
+        
+        logger = get_logger("test.cached")
+        
+        assert manager.loggers["test.cached"] is logger
 
 
 if __name__ == "__main__":
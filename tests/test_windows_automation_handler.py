@@ -6,6 +6,7 @@ This module tests the main automation handler that coordinates all ChatGPT inter
 
 import pytest
 import asyncio
+import threading
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any, List
 
@@ -190,7 +191,8 @@ class TestWindowsAutomationHandler:
         automation_handler.window_manager.focus_window.return_value = True
         
         with patch('src.windows_automation.pyautogui') as mock_pyautogui, \
-             patch.object(automation_handler, '_verify_conversation_reset', return_value=True):
+             patch.object(automation_handler, '_verify_conversation_reset',
+                          new_callable=AsyncMock, return_value=True):
             
             result = await automation_handler.reset_conversation()
         
@@ -226,6 +228,36 @@ class TestWindowsAutomationHandler:
         # Should return False
         assert result is False
     
+    @pytest.mark.asyncio
+    async def test_gui_operations_are_serialized(self, automation_handler, mock_window_info):
+        """Test that a message is not sent while a history capture drives the window."""
+        automation_handler.window_manager.find_chatgpt_window.return_value = mock_window_info
+        automation_handler.window_manager.focus_window.return_value = True
+        automation_handler.message_sender.send_message.return_value = True
+        automation_handler.response_capture.capture_response.return_value = "Hi there!"
+        
+        capture_started = threading.Event()
+        release_capture = threading.Event()
+        
+        def blocking_capture(window_info):
+            capture_started.set()
+            release_capture.wait(timeout=5)
+            return "User: Hello"
+        
+        with patch.object(automation_handler, '_capture_conversation_area', side_effect=blocking_capture):
+            history_task = asyncio.create_task(automation_handler.get_conversation_history())
+            await asyncio.get_running_loop().run_in_executor(None, capture_started.wait, 5)
+            
+            send_task = asyncio.create_task(automation_handler.send_message_and_get_response("Hello"))
+            await asyncio.sleep(0.05)
+            automation_handler.message_sender.send_message.assert_not_called()
+            
+            release_capture.set()
+            await history_task
+            assert await send_task == "Hi there!"
+        
+        automation_handler.message_sender.send_message.assert_called_once_with("Hello")
+    
     @pytest.mark.asyncio
     async def test_cleanup(self, automation_handler):
         """Test cleanup method."""
@@ -277,6 +309,42 @@ class TestWindowsAutomationHandler:
         # Should return only the last 3 messages
         assert len(result) == 3
     
+    @pytest.mark.parametrize("max_messages", [0, -1])
+    def test_parse_conversation_history_non_positive_limit(self, mock_config_manager, max_messages):
+        """Test that a non-positive max_messages returns the whole conversation."""
+        handler = WindowsAutomationHandler(mock_config_manager)
+        conversation_text = "User: a\nAssistant: b\nUser: c"
+        
+        result = handler._parse_conversation_history(conversation_text, max_messages)
+        
+        assert result == [
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "b"},
+            {"role": "user", "content": "c"},
+        ]
+    
+    def test_parse_conversation_history_prefixes_take_precedence(self, mock_config_manager):
+        """Test that explicit role prefixes override the question heuristic."""
+        handler = WindowsAutomationHandler(mock_config_manager)
+        conversation_text = "User: Hello\nAssistant: Shall we start?\nWhat would you like to know?"
+        
+        result = handler._parse_conversation_history(conversation_text, 10)
+        
+        assert len(result) == 2
+        assert result[1]["role"] == "assistant"
+        assert result[1]["content"] == "Shall we start?\nWhat would you like to know?"
+    
+    def test_parse_conversation_history_returns_fresh_dicts(self, mock_config_manager):
+        """Test that mutating a parsed message does not affect later parses."""
+        handler = WindowsAutomationHandler(mock_config_manager)
+        conversation_text = "User: Hello\nAssistant: Hi there!"
+        
+        first = handler._parse_conversation_history(conversation_text, 10)
+        first[0]["content"] = "changed"
+        second = handler._parse_conversation_history(conversation_text, 10)
+        
+        assert second[0]["content"] == "Hello"
+    
     def test_looks_like_user_message_positive_cases(self, mock_config_manager):
         """Test _looks_like_user_message with positive cases."""
         handler = WindowsAutomationHandler(mock_config_manager)
@@ -309,10 +377,12 @@ class TestWindowsAutomationHandler:
             result = handler._looks_like_user_message(message)
             assert result is False, f"Should not detect '{message}' as user message"
     
-    def test_verify_conversation_reset_placeholder(self, mock_config_manager):
+    @pytest.mark.asyncio
+    async def test_verify_conversation_reset_placeholder(self, mock_config_manager):
         """Test _verify_conversation_reset placeholder implementation."""
         handler = WindowsAutomationHandler(mock_config_manager)
-        result = handler._verify_conversation_reset()
+        with patch('src.windows_automation.asyncio.sleep', new=AsyncMock()):
+            result = await handler._verify_conversation_reset()
         
         # Placeholder implementation should return True
         assert result is True
\ No newline at end of file